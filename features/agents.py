@@ -7,8 +7,31 @@
 """
 
 from typing import Optional
+from utils.patterns import compile_keywords
 from utils.context import get_event
 
+# 關鍵字表：代理 → 觸發詞（詞首匹配、不分大小寫）
+AGENT_KEYWORDS = {
+    'code-review': ['code review', 'review code', 'peer review'],
+    'security': ['security', 'cybersecurity', 'vulnerability', 'secure', 'insecure'],
+    'performance': ['performance', 'optimize', 'slow'],
+    'architecture': ['architecture', 'design pattern', 'structure'],
+}
+
+# 代理數據庫
+AGENT_INFO = {
+    'code-review': 'Code Review Agent: Analyzing code quality, style, and best practices.',
+    'security': 'Security Agent: Checking for vulnerabilities and security issues.',
+    'performance': 'Performance Agent: Optimizing code for speed and efficiency.',
+    'architecture': 'Architecture Agent: Evaluating system design and structure.',
+}
+
+# 載入時每個代理預編譯一條 alternation，匹配時一次 C 層掃描取代逐詞 `in`
+_AGENT_PATTERNS = {
+    agent: compile_keywords(kws)
+    for agent, kws in AGENT_KEYWORDS.items()
+}
+
 def process() -> Optional[str]:
     """處理代理匹配
 
@@ -47,22 +70,7 @@ def match_agents(text: str) -> list:
     Returns:
         匹配的代理列表
     """
-    # 簡單的關鍵字匹配
-    keywords = {
-        'code-review': ['code review', 'review code', 'peer review'],
-        'security': ['security', 'vulnerability', 'secure'],
-        'performance': ['performance', 'optimize', 'slow'],
-        'architecture': ['architecture', 'design pattern', 'structure'],
-    }
-
-    matched = []
-    text_lower = text.lower()
-
-    for agent, keywords_list in keywords.items():
-        if any(kw in text_lower for kw in keywords_list):
-            matched.append(agent)
-
-    return matched
+    return [agent for agent, pattern in _AGENT_PATTERNS.items() if pattern.search(text)]
 
 def get_agent_info(agent: str) -> Optional[str]:
     """取得代理信息
@@ -73,12 +81,4 @@ def get_agent_info(agent: str) -> Optional[str]:
     Returns:
         代理信息或 None
     """
-    # 代理數據庫
-    agents_db = {
-        'code-review': 'Code Review Agent: Analyzing code quality, style, and best practices.',
-        'security': 'Security Agent: Checking for vulnerabilities and security issues.',
-        'performance': 'Performance Agent: Optimizing code for speed and efficiency.',
-        'architecture': 'Architecture Agent: Evaluating system design and structure.',
-    }
-
-    return agents_db.get(agent)
+    return AGENT_INFO.get(agent)
@@ -36,8 +36,8 @@ def process() -> Optional[str]:
 
 def _extract_keywords(text: str) -> list:
     """提取關鍵詞"""
-    words = text.split()
-    return [w.lower() for w in words if len(w) > 2]
+    # 整段只 lower 一次；dict.fromkeys 單次走訪去重並保留順序
+    return list(dict.fromkeys(w for w in text.lower().split() if len(w) > 2))
 
 def _match_rules(keywords: list) -> list:
     """匹配規則"""
@@ -50,9 +50,10 @@ def _match_rules(keywords: list) -> list:
         aql = """
         FOR rule IN rules
           FILTER rule.enabled == true
+          LET content = LOWER(rule.content)
           LET score = LENGTH(
             FOR kw IN @keywords
-              FILTER kw IN rule.keywords OR CONTAINS(LOWER(rule.content), kw)
+              FILTER kw IN rule.keywords OR CONTAINS(content, kw)
               RETURN 1
           )
           FILTER score > 0
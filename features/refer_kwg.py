@@ -36,8 +36,8 @@ def process() -> Optional[str]:
 
 def _extract_keywords(text: str) -> list:
     """提取關鍵詞"""
-    words = text.split()
-    return [w.lower() for w in words if len(w) > 3]
+    # 整段只 lower 一次；dict.fromkeys 單次走訪去重並保留順序
+    return list(dict.fromkeys(w for w in text.lower().split() if len(w) > 3))
 
 def _query_kwg(keywords: list) -> list:
     """查詢知識圖譜"""
@@ -49,9 +49,10 @@ def _query_kwg(keywords: list) -> list:
 
         aql = """
         FOR doc IN knowledge
+          LET content = LOWER(doc.content)
           LET score = LENGTH(
             FOR kw IN @keywords
-              FILTER CONTAINS(LOWER(doc.content), kw)
+              FILTER CONTAINS(content, kw)
               RETURN 1
           )
           FILTER score > 0
@@ -6,8 +6,31 @@
 """
 
 from typing import Optional
+from utils.patterns import compile_keywords
 from utils.context import get_event
 
+# 關鍵字表：技能 → 觸發詞（詞首匹配、不分大小寫）
+SKILL_KEYWORDS = {
+    'refactor': ['refactor', 'rewrite', 'restructure'],
+    'debug': ['debug', 'troubleshoot', 'fix bug'],
+    'test': ['test', 'unit test', 'testing', 'pytest', 'unittest'],
+    'document': ['document', 'undocumented', 'write doc', 'docstring'],
+}
+
+# 技能數據庫
+SKILL_INFO = {
+    'refactor': 'Refactor skill: Breaking down complex code into cleaner, more maintainable pieces.',
+    'debug': 'Debug skill: Systematic approach to identify and fix issues.',
+    'test': 'Test skill: Writing comprehensive unit and integration tests.',
+    'document': 'Document skill: Clear and comprehensive documentation practices.',
+}
+
+# 載入時每個技能預編譯一條 alternation，匹配時一次 C 層掃描取代逐詞 `in`
+_SKILL_PATTERNS = {
+    skill: compile_keywords(kws)
+    for skill, kws in SKILL_KEYWORDS.items()
+}
+
 def process() -> Optional[str]:
     """處理技能匹配
 
@@ -46,22 +69,7 @@ def match_skills(text: str) -> list:
     Returns:
         匹配的技能列表
     """
-    # 簡單的關鍵字匹配
-    keywords = {
-        'refactor': ['refactor', 'rewrite', 'restructure'],
-        'debug': ['debug', 'troubleshoot', 'fix bug'],
-        'test': ['test', 'unit test', 'testing'],
-        'document': ['document', 'write doc', 'docstring'],
-    }
-
-    matched = []
-    text_lower = text.lower()
-
-    for skill, keywords_list in keywords.items():
-        if any(kw in text_lower for kw in keywords_list):
-            matched.append(skill)
-
-    return matched
+    return [skill for skill, pattern in _SKILL_PATTERNS.items() if pattern.search(text)]
 
 def get_skill_info(skill: str) -> Optional[str]:
     """取得技能信息
@@ -72,12 +80,4 @@ def get_skill_info(skill: str) -> Optional[str]:
     Returns:
         技能信息或 None
     """
-    # 技能數據庫
-    skills_db = {
-        'refactor': 'Refactor skill: Breaking down complex code into cleaner, more maintainable pieces.',
-        'debug': 'Debug skill: Systematic approach to identify and fix issues.',
-        'test': 'Test skill: Writing comprehensive unit and integration tests.',
-        'document': 'Document skill: Clear and comprehensive documentation practices.',
-    }
-
-    return skills_db.get(skill)
+    return SKILL_INFO.get(skill)
@@ -9,9 +9,20 @@
 - #tags (推薦)
 - /tags (向後兼容，自動轉換為 #tags)
 """
+import importlib
 from typing import Optional
 from utils.context import get_event
 
+# 子命令 → 子模組
+_SUBCOMMANDS = {
+    'todo': 'features.tags.todo',
+    'note': 'features.tags.note',
+    'search': 'features.tags.search',
+}
+
+# 支援的命令前綴（str.startswith 直接接受 tuple）
+_PREFIXES = ('#tags', '/tags')
+
 
 def process() -> Optional[str]:
     """處理 tags 命令"""
@@ -19,11 +30,10 @@ def process() -> Optional[str]:
     prompt = event.prompt if hasattr(event, 'prompt') else ''
 
     # 檢查前綴（同時支援 #tags 與 /tags）
-    if prompt.startswith("#tags"):
-        # shlex parser 以 /command 為 command 型態判斷
-        prompt = "/" + prompt[1:]
-    elif not prompt.startswith("/tags"):
+    if not prompt.startswith(_PREFIXES):
         return None
+    # shlex parser 以 /command 為 command 型態判斷
+    prompt = "/" + prompt[1:]
 
     # 使用 shlex 解析器保留引號
     from utils.parsers.shlex_parser import parse as shlex_parse
@@ -42,20 +52,13 @@ def process() -> Optional[str]:
     tags = parsed.get('tags', [])
     flags = parsed.get('flags', {})
 
-    # 路由到子模組
-    if sub == 'todo':
-        from features.tags import todo
-        return todo.handle(action, args, tags, flags)
-    elif sub == 'note':
-        from features.tags import note
-        return note.handle(action, args, tags, flags)
-    elif sub == 'search':
-        from features.tags import search
-        return search.handle(action, args, tags, flags)
-    elif sub == 'help':
+    # 路由到子模組（查表，延遲 import）
+    module_name = _SUBCOMMANDS.get(sub)
+    if module_name is None:
         return _help()
 
-    return _help()
+    mod = importlib.import_module(module_name)
+    return mod.handle(action, args, tags, flags)
 
 
 def _help() -> str:
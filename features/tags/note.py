@@ -13,8 +13,8 @@ logger = logging.getLogger(__name__)
 def handle(action: str, args: List[str], tags: List[str], flags: Dict[str, Any]) -> str:
     """處理 /tags note 命令"""
 
-    # 幫助命令不需要 DB
-    if action == 'help':
+    # 幫助命令與未知 action 不需要 DB
+    if action not in _ACTIONS:
         return _help()
 
     # 檢查 DB 連接
@@ -42,6 +42,10 @@ def handle(action: str, args: List[str], tags: List[str], flags: Dict[str, Any])
     return _help()
 
 
+# handle() 支援的 action（其餘一律回傳說明，不連 DB）
+_ACTIONS = frozenset({'add', 'list', 'search', 'rm', 'remove'})
+
+
 def add(db, content: str, tags: Optional[List[str]] = None) -> str:
     """新增筆記"""
     if not content:
@@ -131,9 +135,10 @@ def search_notes(db, query: str, filter_tags: Optional[List[str]] = None) -> str
 
         aql = """
         FOR n IN notes
+          LET content = LOWER(n.content)
           LET score = LENGTH(
             FOR term IN @terms
-              FILTER CONTAINS(LOWER(n.content), LOWER(term))
+              FILTER CONTAINS(content, LOWER(term))
                  OR term IN n.tags
               RETURN 1
           )
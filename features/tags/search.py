@@ -52,9 +52,10 @@ def search(db, query: str, filter_tags: Optional[List[str]] = None) -> str:
         LET results = (
             // 搜尋 notes
             FOR n IN notes
+              LET n_content = LOWER(n.content)
               LET score = LENGTH(
                 FOR term IN @terms
-                  FILTER CONTAINS(LOWER(n.content), LOWER(term))
+                  FILTER CONTAINS(n_content, LOWER(term))
                      OR term IN n.tags
                   RETURN 1
               )
@@ -71,9 +72,10 @@ def search(db, query: str, filter_tags: Optional[List[str]] = None) -> str:
         LET todos = (
             // 搜尋 todos
             FOR t IN todos
+              LET t_content = LOWER(t.content)
               LET score = LENGTH(
                 FOR term IN @terms
-                  FILTER CONTAINS(LOWER(t.content), LOWER(term))
+                  FILTER CONTAINS(t_content, LOWER(term))
                      OR term IN t.tags
                   RETURN 1
               )
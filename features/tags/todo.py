@@ -12,6 +12,7 @@
 import os
 import hashlib
 import logging
+from collections import Counter
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -20,12 +21,12 @@ logger = logging.getLogger(__name__)
 
 def handle(action: str, args: List[str], tags: List[str], flags: Dict[str, Any]) -> str:
     """處理 /tags todo 命令"""
-    # 幫助命令不需要 DB
-    if action == 'help':
+    # 幫助命令與未知 action 不需要 DB
+    if action not in _ACTIONS:
         return _help()
 
     # 修正 shlex 的 flag 值問題
-    for flag_key in ['p', 'P', 'priority']:
+    for flag_key in ('p', 'P', 'priority'):
         if flags.get(flag_key) is True and args:
             flags[flag_key] = args.pop(0)
 
@@ -73,6 +74,10 @@ def handle(action: str, args: List[str], tags: List[str], flags: Dict[str, Any])
     return _help()
 
 
+# handle() 支援的 action（其餘一律回傳說明，不連 DB）
+_ACTIONS = frozenset({'add', 'list', 'done', 'rm', 'remove', 'update', 'projects', 'import'})
+
+
 def _resolve_project(flags: Dict) -> str:
     """判斷專案名"""
     if flags.get('p'):
@@ -92,6 +97,14 @@ def _resolve_project(flags: Dict) -> str:
     return project or '_user'
 
 
+# 優先級名稱 → 數值（單次查表取代逐組比對）
+_PRIORITY_NAMES = {
+    'high': 8, 'h': 8,
+    'mid': 5, 'm': 5, 'medium': 5,
+    'low': 2, 'l': 2,
+}
+
+
 def _parse_priority(flags: Dict) -> int:
     """解析優先級"""
     p = flags.get('priority') or flags.get('P')
@@ -103,13 +116,9 @@ def _parse_priority(flags: Dict) -> int:
         return max(1, min(10, p))
 
     if isinstance(p, str):
-        p_lower = p.lower()
-        if p_lower in ('high', 'h'):
-            return 8
-        elif p_lower in ('mid', 'm', 'medium'):
-            return 5
-        elif p_lower in ('low', 'l'):
-            return 2
+        named = _PRIORITY_NAMES.get(p.lower())
+        if named is not None:
+            return named
         try:
             return max(1, min(10, int(p)))
         except ValueError:
@@ -240,36 +249,33 @@ def list_todos(db, project: str, filter_tags: Optional[List[str]] = None, show_d
             render_todo(t)
 
         # 統計全局和當前專案
-        global_aql = """
-        FOR doc IN todos
-          FILTER (doc.project != null AND doc.project != true) OR doc.project == null
-          COLLECT status = doc.status
-          RETURN {status: status, count: LENGTH(1)}
-        """
-        global_stats_results = query_aql(global_aql)
-        global_stats = {s.get('status', 'pending'): s.get('count', 0) for s in (global_stats_results or [])}
+        # 已取回的 todos 就是當前範圍的完整集合，直接在本地彙總，省一次 DB 往返
+        scope_stats = Counter(t.get('status') for t in todos)
+
+        if project == '_user':
+            global_stats = scope_stats
+        else:
+            global_aql = """
+            FOR doc IN todos
+              FILTER (doc.project != null AND doc.project != true) OR doc.project == null
+              COLLECT status = doc.status WITH COUNT INTO count
+              RETURN {status: status, count: count}
+            """
+            global_stats_results = query_aql(global_aql)
+            global_stats = {s.get('status', 'pending'): s.get('count', 0) for s in (global_stats_results or [])}
+
         global_total = sum(global_stats.values())
         global_pending = global_stats.get('pending', 0)
         global_done = global_stats.get('done', 0)
 
+        stats_line = f"\n**全局** {global_total} 総計, 🔍 觀察 {global_done}, ⏳ 未完成 {global_pending}"
+
         # 當前專案統計（非全局模式時）
         if project != '_user':
-            project_aql = """
-            FOR doc IN todos
-              FILTER doc.project == @project
-              COLLECT status = doc.status
-              RETURN {status: status, count: LENGTH(1)}
-            """
-            project_stats_results = query_aql(project_aql, bind_vars={'project': project})
-            project_stats = {s.get('status', 'pending'): s.get('count', 0) for s in (project_stats_results or [])}
-            project_total = sum(project_stats.values())
-            project_pending = project_stats.get('pending', 0)
-            project_done = project_stats.get('done', 0)
-
-            stats_line = f"\n**全局** {global_total} 総計, 🔍 觀察 {global_done}, ⏳ 未完成 {global_pending}"
+            project_total = len(todos)
+            project_pending = scope_stats.get('pending', 0)
+            project_done = scope_stats.get('done', 0)
             stats_line += f" | **{project}** {project_total} 総計, 🔍 觀察 {project_done}, ⏳ 未完成 {project_pending}"
-        else:
-            stats_line = f"\n**全局** {global_total} 総計, 🔍 觀察 {global_done}, ⏳ 未完成 {global_pending}"
 
         lines.append(stats_line)
         lines.append("\n💡 Claude: 請在回應中直接引用此 TODO 列表回報給用戶")
@@ -387,16 +393,15 @@ def import_json(db, project: str, json_file: str) -> str:
     if not json_file:
         return "請提供 JSON 檔案路徑"
 
-    import json
     from pathlib import Path
+    from utils import fastjson
 
     try:
         json_path = Path(json_file).expanduser()
         if not json_path.exists():
             return f"❌ 檔案不存在: {json_file}"
 
-        with json_path.open('r', encoding='utf-8') as f:
-            todos = json.load(f)
+        todos = fastjson.load_file(json_path)
 
         if not isinstance(todos, list):
             return "❌ JSON 格式錯誤，必須是陣列"
@@ -474,7 +479,7 @@ def import_json(db, project: str, json_file: str) -> str:
 
         return summary + "\n" + "\n".join(result_lines)
 
-    except json.JSONDecodeError as e:
+    except fastjson.JSONDecodeError as e:
         return f"❌ JSON 解析失敗: {e}"
     except Exception as e:
         logger.error(f"Import error: {e}")
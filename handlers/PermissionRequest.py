@@ -9,6 +9,13 @@ from typing import Optional, Dict, Any
 from type_defs import HookResult
 from utils.context import get_event
 
+# action → 未提供 reason 時的預設理由
+_DEFAULT_REASONS = {
+    'deny': 'Denied',
+    'ask': 'Confirm?',
+    'allow': None,
+}
+
 
 async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
     """處理 PermissionRequest 事件
@@ -26,35 +33,19 @@ async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
     Returns:
         HookResult with permission decision
     """
-    
-
     event = get_event()
 
     if event.hook_event_name != 'PermissionRequest':
         return None
 
     action = rule.get('action', 'allow')
-    reason = rule.get('reason')
-
-    # 1. deny: 拒絕權限請求
-    if action == 'deny':
-        return HookResult(
-            event_name='PermissionRequest',
-            permission='deny',
-            permission_reason=reason or 'Denied'
-        )
-
-    # 2. ask: 詢問使用者確認
-    if action == 'ask':
-        return HookResult(
-            event_name='PermissionRequest',
-            permission='ask',
-            permission_reason=reason or 'Confirm?'
-        )
-
-    # 3. allow: 允許權限請求
+
+    # deny/ask/allow 查表決定預設理由；未知 action 視為 allow
+    if action not in _DEFAULT_REASONS:
+        action = 'allow'
+
     return HookResult(
         event_name='PermissionRequest',
-        permission='allow',
-        permission_reason=reason
+        permission=action,
+        permission_reason=rule.get('reason') or _DEFAULT_REASONS[action]
     )
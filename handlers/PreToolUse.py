@@ -6,13 +6,16 @@ Responsibilities:
 - Support updatedInput transformation
 """
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Pattern
 from type_defs import HookResult
 from utils.context import get_event
 from utils.logger import get_logger
+from utils.patterns import compile_pattern
 
 logger = get_logger("handlers.PreToolUse")
 
+_MISSING = object()
+
 
 async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
     """Process PreToolUse event
@@ -61,7 +64,8 @@ async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
         logger.debug(f"Rule {rule_name}: Applying updatedInput transformation")
         updated_input = _apply_updated_input(
             rule['updatedInput'],
-            event.tool_input
+            event.tool_input,
+            rule.get('_updated_input_re')
         )
         if updated_input:
             logger.info(f"Rule {rule_name}: Transformed tool input")
@@ -76,7 +80,8 @@ async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
 
 def _apply_updated_input(
     config: Dict[str, Any],
-    tool_input: Any
+    tool_input: Any,
+    compiled: Optional[Pattern[str]] = None
 ) -> Optional[Dict[str, Any]]:
     """應用 updatedInput 轉換
 
@@ -91,6 +96,7 @@ def _apply_updated_input(
                 'replace': 'trash-put'   # 替換為新值
             }
         tool_input: 原始工具輸入
+        compiled: 載入時預編譯的 pattern（loaders.rules 提供），無則經快取編譯
 
     Returns:
         轉換後的 tool_input，若無需轉換返回 None
@@ -108,38 +114,44 @@ def _apply_updated_input(
     if not all([field, pattern, replace]):
         return None
 
-    # object-first input normalization
-    if isinstance(tool_input, dict):
-        tool_input_dict = dict(tool_input)
+    # 先只讀取目標欄位；確定有改寫時才複製整個 tool_input（copy-on-write）
+    getter = getattr(tool_input, "get", None)
+    if callable(getter):
+        original = getter(field, _MISSING)
     else:
-        to_dict = getattr(tool_input, "to_dict", None)
-        if callable(to_dict):
-            tool_input_dict = to_dict()
-        else:
-            items = getattr(tool_input, "items", None)
-            if callable(items):
-                tool_input_dict = dict(items())
-            else:
-                return None
+        items = getattr(tool_input, "items", None)
+        if not callable(items):
+            return None
+        original = dict(items()).get(field, _MISSING)
 
     # 檢查 field 是否存在
-    if field not in tool_input_dict:
+    if original is _MISSING:
         return None
 
-    original = tool_input_dict[field]
-
     # 執行 pattern 替換
     try:
-        # 使用 re.sub 進行替換（會替換所有匹配）
-        modified = re.sub(pattern, replace, original)
+        # 使用 Pattern.sub 進行替換（會替換所有匹配）
+        if compiled is None:
+            compiled = compile_pattern(pattern)
+        modified = compiled.sub(replace, original)
 
         # 若沒有改變，返回 None
         if modified == original:
             return None
 
         # 返回更新後的 tool_input
-        return {**tool_input_dict, field: modified}
+        return {**_to_plain_dict(tool_input), field: modified}
 
     except re.error:
         # Pattern 無效，返回 None
         return None
+
+
+def _to_plain_dict(tool_input: Any) -> Dict[str, Any]:
+    """object-first input normalization（dict / TreeObject / items()）"""
+    if isinstance(tool_input, dict):
+        return tool_input
+    to_dict = getattr(tool_input, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return dict(tool_input.items())
@@ -5,10 +5,11 @@
 - 支援 context action（直接注入）
 - 支援 load action（載入檔案）
 """
-from pathlib import Path
+import asyncio
 from typing import Optional, Dict, Any
 from type_defs import HookResult
 from utils.context import get_event
+from utils.files import read_text_file
 
 
 async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
@@ -49,12 +50,12 @@ async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
 
     # load action：載入檔案
     if action == 'load':
-        return _load_files(rule)
+        return await _load_files(rule)
 
     return None
 
 
-def _load_files(rule: Dict[str, Any]) -> Optional[HookResult]:
+async def _load_files(rule: Dict[str, Any]) -> Optional[HookResult]:
     """載入檔案到 additionalContext
 
     規則設定格式：
@@ -74,7 +75,7 @@ def _load_files(rule: Dict[str, Any]) -> Optional[HookResult]:
         HookResult with additionalContext if files loaded successfully, otherwise None
     """
     loaders = rule.get('loaders', [])
-    contents = []
+    entries = []
 
     for loader in loaders:
         if not isinstance(loader, dict):
@@ -92,14 +93,18 @@ def _load_files(rule: Dict[str, Any]) -> Optional[HookResult]:
         if not path:
             continue
 
-        try:
-            expanded = Path(path).expanduser()
-            content = expanded.read_text(encoding='utf-8')
-            label = loader.get('label', path)
-            contents.append(f"## {label}\n\n{content}")
-        except Exception:
-            # 忽略讀取失敗的檔案
-            pass
+        entries.append((path, loader.get('label', path)))
+
+    if not entries:
+        return None
+
+    # 檔案讀取丟到 thread 並發執行，避免阻塞 event loop
+    texts = await asyncio.gather(*(asyncio.to_thread(read_text_file, path) for path, _ in entries))
+    contents = [
+        f"## {label}\n\n{text}"
+        for (_, label), text in zip(entries, texts)
+        if text is not None
+    ]
 
     if contents:
         return HookResult(
@@ -6,10 +6,11 @@
 - 支援 load action（從檔案載入）
 - 支援 loaders 配置（file type）
 """
-from pathlib import Path
+import asyncio
 from typing import Optional, Dict, Any
 from type_defs import HookResult
 from utils.context import get_event
+from utils.files import read_text_file
 
 
 async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
@@ -69,7 +70,7 @@ async def _load_files(rule: dict) -> Optional[HookResult]:
         HookResult with additional_context if files loaded, otherwise None
     """
     loaders = rule.get('loaders', [])
-    contents = []
+    entries = []
 
     for loader in loaders:
         if not isinstance(loader, dict):
@@ -83,13 +84,18 @@ async def _load_files(rule: dict) -> Optional[HookResult]:
         if not path:
             continue
 
-        try:
-            expanded = Path(path).expanduser()
-            content = expanded.read_text(encoding='utf-8')
-            label = loader.get('label', path)
-            contents.append(f"## {label}\n\n{content}")
-        except Exception:
-            pass
+        entries.append((path, loader.get('label', path)))
+
+    if not entries:
+        return None
+
+    # 檔案讀取丟到 thread 並發執行，避免阻塞 event loop
+    texts = await asyncio.gather(*(asyncio.to_thread(read_text_file, path) for path, _ in entries))
+    contents = [
+        f"## {label}\n\n{text}"
+        for (_, label), text in zip(entries, texts)
+        if text is not None
+    ]
 
     if contents:
         return HookResult(
@@ -6,10 +6,15 @@
 - 整合結果
 """
 import asyncio
-from typing import Optional, List, Dict, Any
+import importlib
+import inspect
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from type_defs import HookResult
 from utils.context import get_event
 
+# feature 名稱 → (process, is_async)，每個 feature 只 import/檢查一次
+_feature_cache: Dict[str, Optional[Tuple[Callable, bool]]] = {}
+
 
 async def process(rule: Dict[str, Any]) -> Optional[HookResult]:
     """工作流編排
@@ -75,6 +80,25 @@ async def _run_features(feature_names: List[str]) -> List[str]:
     return [r for r in results if r and not isinstance(r, Exception)]
 
 
+def _resolve_feature(feature_name: str) -> Optional[Tuple[Callable, bool]]:
+    """import feature 並快取 (process, is_async)
+
+    Returns:
+        (process 函數, 是否為 coroutine function)；模組沒有 process 時返回 None
+
+    Raises:
+        ModuleNotFoundError: 找不到 feature 模組（不快取，交由呼叫端處理）
+    """
+    if feature_name in _feature_cache:
+        return _feature_cache[feature_name]
+
+    mod = importlib.import_module(f"features.{feature_name}")
+    process_fn = getattr(mod, 'process', None)
+    resolved = (process_fn, inspect.iscoroutinefunction(process_fn)) if process_fn else None
+    _feature_cache[feature_name] = resolved
+    return resolved
+
+
 async def _call_feature(feature_name: str) -> Optional[str]:
     """調用 feature 模組
 
@@ -82,18 +106,20 @@ async def _call_feature(feature_name: str) -> Optional[str]:
           直接從 EventContext 取 event
     """
     try:
-        import importlib
-        mod = importlib.import_module(f"features.{feature_name}")
-
-        if not hasattr(mod, 'process'):
+        resolved = _resolve_feature(feature_name)
+        if resolved is None:
             return f"⚠️ feature '{feature_name}' 沒有 process 函數"
+        process_fn, is_async = resolved
 
         # process() 無參數,從全局取 event
-        result = mod.process()
-
-        # 支援 async
-        if hasattr(result, '__await__'):
-            result = await result
+        # 同步 feature 丟到共用 thread pool（asyncio.to_thread），避免阻塞 event loop
+        if is_async:
+            result = await process_fn()
+        else:
+            result = await asyncio.to_thread(process_fn)
+            # 看似同步的 process()（如被 decorator 包裝）可能回傳 coroutine
+            if inspect.isawaitable(result):
+                result = await result
 
         # 處理不同返回類型
         if isinstance(result, HookResult):
@@ -9,31 +9,49 @@ Responsibilities:
 
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from utils.files import decode_text
 from utils.logger import get_logger
+from utils.patterns import compile_pattern
 
 logger = get_logger("loaders.rules")
 
 RULES_DIR = Path(__file__).parent.parent / "config" / "rules"
 FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n?', re.DOTALL)
 
+# libyaml-backed safe loader when PyYAML was built with it; pure-Python fallback
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 _rules_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
 _rules_by_event_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
 
+def flag_needles(flags: List[Any]) -> Tuple[Tuple[str, str], ...]:
+    """Build ('-x', '--x') substring pairs for match.flags"""
+    return tuple((f'-{flag}', f'--{flag}') for flag in flags)
+
+
 def _parse_rule_file(filepath: Path) -> Optional[Dict[str, Any]]:
     """Parse single rule file with validation
 
     Returns:
         Rule dict or None (if parse failed, disabled, or validation failed)
     """
+    # One binary read, decode in memory (no TextIOWrapper per file)
     try:
-        content = filepath.read_text(encoding='utf-8')
+        raw = filepath.read_bytes()
     except Exception as e:
         logger.error(f"Failed to read rule file {filepath.name}: {e}")
         return None
 
+    try:
+        content = decode_text(raw)
+    except UnicodeDecodeError as e:
+        logger.error(f"Rule file is not valid UTF-8 ({filepath.name}): {e}")
+        return None
+
     # Parse frontmatter
     match = FRONTMATTER_RE.match(content)
     if not match:
@@ -41,7 +59,7 @@ def _parse_rule_file(filepath: Path) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        rule = yaml.safe_load(match.group(1))
+        rule = yaml.load(match.group(1), Loader=YAML_LOADER)
     except yaml.YAMLError as e:
         logger.error(f"YAML parse failed ({filepath.name}): {e}")
         return None
@@ -73,23 +91,41 @@ def _parse_rule_file(filepath: Path) -> Optional[Dict[str, Any]]:
     match_config = rule.get('match')
     if isinstance(match_config, str):
         try:
-            rule['_match_re'] = re.compile(match_config)
+            rule['_match_re'] = compile_pattern(match_config)
         except re.error as e:
             logger.warning(f"Invalid regex in {filepath.name}: {e}")
             return None
     elif isinstance(match_config, dict):
         if 'cmd' in match_config and isinstance(match_config['cmd'], str):
             try:
-                rule['_cmd_re'] = re.compile(match_config['cmd'])
+                rule['_cmd_re'] = compile_pattern(match_config['cmd'])
             except re.error as e:
                 logger.warning(f"Invalid cmd regex in {filepath.name}: {e}")
                 return None
         if 'args' in match_config and isinstance(match_config['args'], str):
             try:
-                rule['_args_re'] = re.compile(match_config['args'])
+                rule['_args_re'] = compile_pattern(match_config['args'])
             except re.error as e:
                 logger.warning(f"Invalid args regex in {filepath.name}: {e}")
                 return None
+        # Precompute struct-match parameters (set lookup / flag needles)
+        if isinstance(match_config.get('any_cmd'), list):
+            try:
+                rule['_any_cmd'] = frozenset(match_config['any_cmd'])
+            except TypeError as e:
+                # Non-string items (e.g. nested mappings): router falls back to the raw list
+                logger.warning(f"Unhashable any_cmd item in {filepath.name}, precompute skipped: {e}")
+        if isinstance(match_config.get('flags'), list):
+            rule['_flag_needles'] = flag_needles(match_config['flags'])
+
+    # Precompile updatedInput pattern; an invalid one only disables the transform
+    # (rule is kept so its action, e.g. deny, still applies)
+    updated_input = rule.get('updatedInput')
+    if isinstance(updated_input, dict) and isinstance(updated_input.get('pattern'), str):
+        try:
+            rule['_updated_input_re'] = compile_pattern(updated_input['pattern'])
+        except re.error as e:
+            logger.warning(f"Invalid updatedInput pattern in {filepath.name}, transform skipped: {e}")
 
     # Body content (after frontmatter)
     body = content[match.end():].strip()
@@ -148,7 +184,11 @@ def load() -> List[Dict[str, Any]]:
 
 
 def get_by_event(event_name: str) -> List[Dict[str, Any]]:
-    """Get rules for a specific event (cached index)."""
+    """Get rules for a specific event (cached index).
+
+    Each list is pre-sorted in dispatch order (priority high to low,
+    default 50), so the router does not re-sort per event.
+    """
     global _rules_by_event_cache
     if _rules_by_event_cache is None:
         index: Dict[str, List[Dict[str, Any]]] = {}
@@ -157,13 +197,34 @@ def get_by_event(event_name: str) -> List[Dict[str, Any]]:
             if not isinstance(event, str):
                 continue
             index.setdefault(event, []).append(rule)
+        for event_rules in index.values():
+            event_rules.sort(key=lambda r: r.get('priority', 50), reverse=True)
         _rules_by_event_cache = index
     return _rules_by_event_cache.get(event_name, [])
 
 
+def get_by_event_tool(event_name: str, tool_name: Optional[str]) -> List[Dict[str, Any]]:
+    """Get rules for an event that can apply to tool_name (cached index).
+
+    Rules without a `tool` field apply to every tool; rules with one are
+    kept only when it equals tool_name. Order follows get_by_event().
+    """
+    return _rules_for_tool(event_name, tool_name)
+
+
+@lru_cache(maxsize=256)
+def _rules_for_tool(event_name: str, tool_name: Optional[str]) -> List[Dict[str, Any]]:
+    """Bounded (event, tool) index; tool names are open-ended (MCP tools)"""
+    return [
+        rule for rule in get_by_event(event_name)
+        if 'tool' not in rule or rule['tool'] == tool_name
+    ]
+
+
 def reload():
     """Clear cache and force reload"""
     global _rules_cache, _rules_by_event_cache
     logger.info("Clearing rules cache")
     _rules_cache = None
     _rules_by_event_cache = None
+    _rules_for_tool.cache_clear()
@@ -4,32 +4,34 @@
 只使用官方欄位名。
 """
 
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple
 
 
 # ============================================================
 # 事件類型和支援的 action 映射 (12 events from Claude Code CLI)
+# 唯讀常數：tuple 值 + MappingProxyType，模組載入時建一次
 # ============================================================
-EVENT_ACTIONS = {
-    'PreToolUse': ['allow', 'deny', 'ask', 'transform'],
-    'PostToolUse': ['block'],
-    'PostToolUseFailure': [],  # 無輸出控制
-    'Notification': [],  # 無輸出控制
-    'UserPromptSubmit': ['block'],
-    'SessionStart': ['load', 'context'],
-    'Stop': ['block'],
-    'SubagentStart': ['load', 'context'],
-    'SubagentStop': ['block'],
-    'PreCompact': ['stdout', 'stderr'],  # 輸出到 stdout/stderr 顯示給用戶
-    'SessionEnd': [],  # 無輸出控制
-    'PermissionRequest': ['allow', 'deny'],
-}
+EVENT_ACTIONS = MappingProxyType({
+    'PreToolUse': ('allow', 'deny', 'ask', 'transform'),
+    'PostToolUse': ('block',),
+    'PostToolUseFailure': (),  # 無輸出控制
+    'Notification': (),  # 無輸出控制
+    'UserPromptSubmit': ('block',),
+    'SessionStart': ('load', 'context'),
+    'Stop': ('block',),
+    'SubagentStart': ('load', 'context'),
+    'SubagentStop': ('block',),
+    'PreCompact': ('stdout', 'stderr'),  # 輸出到 stdout/stderr 顯示給用戶
+    'SessionEnd': (),  # 無輸出控制
+    'PermissionRequest': ('allow', 'deny'),
+})
 
 # 必填欄位
-REQUIRED_FIELDS = ['name', 'description', 'event']
+REQUIRED_FIELDS = ('name', 'description', 'event')
 
 # 可選欄位（官方名）
-OPTIONAL_FIELDS = [
+OPTIONAL_FIELDS = (
     # 通用
     'enabled', 'priority', 'action',
     # 匹配
@@ -44,16 +46,19 @@ OPTIONAL_FIELDS = [
     'source', 'subagent_type', 'notification_type', 'trigger',
     # UserPromptSubmit feature
     'feature',
-]
+)
+
+# 所有合法欄位（載入時建一次，驗證每條規則時共用）
+ALL_VALID_FIELDS = frozenset(REQUIRED_FIELDS + OPTIONAL_FIELDS)
 
 # Bash 專用欄位
-BASH_ONLY_FIELDS = ['cmd', 'args_match', 'flags', 'has_flags', 'any_cmd']
+BASH_ONLY_FIELDS = ('cmd', 'args_match', 'flags', 'has_flags', 'any_cmd')
 
 # transform action 需要的欄位
-TRANSFORM_REQUIRED_FIELDS = ['updatedInput']
+TRANSFORM_REQUIRED_FIELDS = ('updatedInput',)
 
 # load action 需要的欄位
-LOAD_REQUIRED_FIELDS = ['loaders']
+LOAD_REQUIRED_FIELDS = ('loaders',)
 
 
 def validate_rule(rule: Dict[str, Any], filepath: str = '') -> Tuple[bool, List[str]]:
@@ -123,11 +128,10 @@ def validate_rule(rule: Dict[str, Any], filepath: str = '') -> Tuple[bool, List[
         errors.append(f"{prefix}feature 必須是陣列")
 
     # 8. 檢查不認識的欄位
-    all_valid_fields = set(REQUIRED_FIELDS + OPTIONAL_FIELDS)
     unknown_fields = {
         k for k in rule.keys()
         if not k.startswith('_')
-    } - all_valid_fields
+    } - ALL_VALID_FIELDS
     if unknown_fields:
         errors.append(f"{prefix}不認識的欄位: {', '.join(unknown_fields)}")
 
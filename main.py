@@ -18,8 +18,10 @@ async def main():
     logger.info("Hook system starting")
 
     # 1. Read stdin (raw JSON)
+    from utils import fastjson
     try:
-        raw_payload = json.load(sys.stdin)
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+        raw_payload = fastjson.loads(stdin.read())
         event_name = raw_payload.get("hook_event_name", "unknown")
         logger.info(f"Received event: {event_name}")
 
@@ -32,11 +34,8 @@ async def main():
                 logger.debug(f"Prompt: {raw_payload['prompt']}")
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON input: {e}")
-        print(json.dumps({
-            'continue': False,
-            'systemMessage': f'Invalid JSON input: {e}'
-        }), file=sys.stdout)
-        sys.exit(1)
+        from output import emit_error
+        emit_error(f'Invalid JSON input: {e}')
 
     # 2. Schema validation (optional, requires jsonschema)
     try:
@@ -44,11 +43,8 @@ async def main():
         error = validate_event(raw_payload)
         if error:
             logger.error(f"Schema validation failed: {error}")
-            print(json.dumps({
-                'continue': False,
-                'systemMessage': f'Schema validation failed: {error}'
-            }), file=sys.stdout)
-            sys.exit(1)
+            from output import emit_error
+            emit_error(f'Schema validation failed: {error}')
         logger.debug("Schema validation passed")
     except ImportError:
         logger.warning("jsonschema not installed, skipping schema validation")
@@ -60,11 +56,8 @@ async def main():
         logger.debug(f"Event object created: {type(event).__name__}")
     except (ValueError, TypeError, KeyError) as e:
         logger.error(f"Failed to parse event object: {e}")
-        print(json.dumps({
-            'continue': False,
-            'systemMessage': f'Invalid event data: {e}'
-        }), file=sys.stdout)
-        sys.exit(1)
+        from output import emit_error
+        emit_error(f'Invalid event data: {e}')
 
     # 4. Set global event context (one-time)
     from utils.context import EventContext
@@ -1,9 +1,9 @@
 """Output Management: merge + emit"""
-import json
 import sys
 import os
 from typing import List, Optional
 from type_defs import HookResult
+from utils import fastjson
 from utils.logger import get_logger
 
 logger = get_logger("output")
@@ -21,69 +21,70 @@ def merge(results: List[HookResult]) -> Optional[HookResult]:
     if len(results) == 1:
         return results[0]
 
-    def _collect_reasons(results: List[HookResult], permission: str) -> List[str]:
-        """收集指定 permission 類型的所有 reasons"""
-        reasons = []
-        for r in results:
-            if getattr(r, 'permission', None) == permission:
-                reason = getattr(r, 'permission_reason', None)
-                if reason:
-                    reasons.append(reason)
-        return reasons
+    # 單次走訪：依 permission / block / context 分桶，各優先級共用
+    by_permission = {'deny': [], 'ask': [], 'allow': []}
+    reasons = {'deny': [], 'ask': [], 'allow': []}
+    block_results = []
+    block_reasons = []
+    contexts = []
+    for r in results:
+        permission = getattr(r, 'permission', None)
+        bucket = by_permission.get(permission)
+        if bucket is not None:
+            bucket.append(r)
+            reason = getattr(r, 'permission_reason', None)
+            if reason:
+                reasons[permission].append(reason)
+        if getattr(r, 'block', False):
+            block_results.append(r)
+            if getattr(r, 'block_reason', None):
+                block_reasons.append(r.block_reason)
+        if getattr(r, 'additional_context', None):
+            contexts.append(r.additional_context)
 
     # 優先級 1: deny
-    deny_results = [r for r in results if getattr(r, 'permission', None) == 'deny']
+    deny_results = by_permission['deny']
     if deny_results:
-        reasons = _collect_reasons(results, 'deny')
         return HookResult(
             event_name=deny_results[0].event_name,
             permission='deny',
-            permission_reason='\n'.join(reasons) if reasons else deny_results[0].permission_reason,
+            permission_reason='\n'.join(reasons['deny']) or deny_results[0].permission_reason,
             interrupt=any(r.interrupt for r in deny_results),
         )
 
     # 優先級 2: ask
-    ask_results = [r for r in results if getattr(r, 'permission', None) == 'ask']
+    ask_results = by_permission['ask']
     if ask_results:
-        reasons = _collect_reasons(results, 'ask')
         return HookResult(
             event_name=ask_results[0].event_name,
             permission='ask',
-            permission_reason='\n'.join(reasons) if reasons else ask_results[0].permission_reason,
+            permission_reason='\n'.join(reasons['ask']) or ask_results[0].permission_reason,
         )
 
     # 優先級 3: allow
-    allow_results = [r for r in results if getattr(r, 'permission', None) == 'allow']
+    allow_results = by_permission['allow']
     if allow_results:
-        reasons = _collect_reasons(results, 'allow')
         # 合併 updated_input - 取第一個有值的
-        merged_updated_input = None
-        for r in allow_results:
-            if getattr(r, 'updated_input', None):
-                merged_updated_input = r.updated_input
-                break
+        merged_updated_input = next(
+            (r.updated_input for r in allow_results if getattr(r, 'updated_input', None)),
+            None
+        )
         return HookResult(
             event_name=allow_results[0].event_name,
             permission='allow',
-            permission_reason='\n'.join(reasons) if reasons else allow_results[0].permission_reason,
+            permission_reason='\n'.join(reasons['allow']) or allow_results[0].permission_reason,
             updated_input=merged_updated_input,
         )
 
     # 優先級 4: block
-    block_results = [r for r in results if getattr(r, 'block', False)]
     if block_results:
-        reasons = [r.block_reason for r in block_results if getattr(r, 'block_reason', None)]
         return HookResult(
             event_name=block_results[0].event_name,
             block=True,
-            block_reason='\n'.join(reasons) if reasons else block_results[0].block_reason,
+            block_reason='\n'.join(block_reasons) or block_results[0].block_reason,
         )
 
     # 優先級 5: 合併 additional_context
-    contexts = [
-        r.additional_context for r in results
-        if getattr(r, 'additional_context', None)
-    ]
     if contexts:
         first = results[0]
         return HookResult(
@@ -103,7 +104,7 @@ def emit(result: Optional[HookResult], event_name: str = ''):
     Optional validation: Set HOOKS_VALIDATE_OUTPUT=1 to enable schema validation
     """
     if not result:
-        print(json.dumps({}))
+        _write('{}')
         sys.exit(0)
 
     output = {}
@@ -144,7 +145,7 @@ def emit(result: Optional[HookResult], event_name: str = ''):
     # 3. Decision 類 (PostToolUse, Stop, SubagentStop)
     if result.block:
         # Stop/SubagentStop 使用 decision+reason
-        if event_name in ['Stop', 'SubagentStop']:
+        if event_name in ('Stop', 'SubagentStop'):
             output['decision'] = 'block'
             if result.block_reason:
                 output['reason'] = result.block_reason
@@ -169,10 +170,25 @@ def emit(result: Optional[HookResult], event_name: str = ''):
         _validate_output(output, event_name)
 
     logger.debug(f"Output keys: {list(output.keys())}")
-    print(json.dumps(output, ensure_ascii=False))
+    _write(fastjson.dumps(output))
     sys.exit(0)
 
 
+def emit_error(message: str):
+    """Output a stop-with-message JSON and exit 1 (main.py input/parse failures)"""
+    _write(fastjson.dumps({
+        'continue': False,
+        'systemMessage': message
+    }))
+    sys.exit(1)
+
+
+def _write(text: str):
+    """單次寫入 stdout 並 flush（取代 print 的格式化與多次 write）"""
+    sys.stdout.write(text + '\n')
+    sys.stdout.flush()
+
+
 def _validate_output(output: dict, event_name: str):
     """Validate output against schema (optional, for development)
 
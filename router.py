@@ -2,12 +2,12 @@ from typing import Dict, Any, List, Optional
 import asyncio
 import importlib
 import inspect
-import re
 
 from type_defs import HookResult, RulePayload
 from utils.context import get_event
 from utils.logger import get_logger
 from utils.parsers.shlex_parser import tokenize
+from utils.patterns import compile_pattern
 from loaders import rules as rules_loader
 
 logger = get_logger("router")
@@ -49,16 +49,19 @@ async def route(rules: List[RulePayload]) -> List[HookResult]:
 
     logger.debug(f"Routing event: {event_name}")
 
-    # Fast path: retrieve rules by event from loader index
+    # Fast path: loader index by (event, tool), already in priority order.
     # Fallback to input list for compatibility in tests/custom calls.
-    event_rules = rules_loader.get_by_event(event_name) if hasattr(rules_loader, "get_by_event") else []
-    if event_rules:
-        matched_rules = event_rules
-    else:
-        matched_rules = [
-            rule for rule in rules
-            if rule.get('enabled', True) and rule.get('event') == event_name
-        ]
+    tool_name = getattr(event, 'tool_name', None)
+    matched_rules = rules_loader.get_by_event_tool(event_name, tool_name)
+    if not matched_rules and not rules_loader.get_by_event(event_name):
+        matched_rules = sorted(
+            (
+                rule for rule in rules
+                if rule.get('enabled', True) and rule.get('event') == event_name
+            ),
+            key=lambda r: r.get('priority', 50),
+            reverse=True
+        )
 
     if not matched_rules:
         logger.debug(f"No rules matched for event: {event_name}")
@@ -77,30 +80,44 @@ async def route(rules: List[RulePayload]) -> List[HookResult]:
         logger.error(f"Failed to import handler for {event_name}: {e}")
         return []
 
-    # Sort by priority (high to low)
-    matched_rules = sorted(
-        matched_rules,
-        key=lambda r: r.get('priority', 50),
-        reverse=True
-    )
+    # Handlers are async-only; bridge a legacy sync process() once here
+    # so _handle_rule has a single await path.
+    if not inspect.iscoroutinefunction(process_fn):
+        logger.debug(f"Handler {event_name} is sync, running in thread")
+        process_fn = _as_async(process_fn)
+
+    # Per-event lookups bound once and shared by every rule
+    command = _event_tool_command(event)
 
     # Execute handlers concurrently
-    tasks = [_handle_rule(rule, process_fn, event_name) for rule in matched_rules]
+    tasks = [_handle_rule(rule, process_fn, event_name, tool_name, command) for rule in matched_rules]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Log exceptions
-    for i, result in enumerate(results):
+    # Log exceptions and keep valid results in one pass
+    valid_results = []
+    for rule, result in zip(matched_rules, results):
         if isinstance(result, Exception):
-            rule_name = matched_rules[i].get('name', 'unknown')
-            logger.error(f"Handler failed for rule '{rule_name}': {result}")
-
-    # Filter valid results
-    valid_results = [r for r in results if r and not isinstance(r, Exception)]
+            logger.error(f"Handler failed for rule '{rule.get('name', 'unknown')}': {result}")
+        elif result:
+            valid_results.append(result)
     logger.debug(f"Returning {len(valid_results)} valid results")
     return valid_results
 
 
-async def _handle_rule(rule: RulePayload, process_fn, event_name: str) -> HookResult:
+def _as_async(fn):
+    """Wrap a sync handler so it runs off the event loop."""
+    async def _run(rule: RulePayload):
+        return await asyncio.to_thread(fn, rule)
+    return _run
+
+
+async def _handle_rule(
+    rule: RulePayload,
+    process_fn,
+    event_name: str,
+    tool_name: Optional[str],
+    command: Optional[str],
+) -> HookResult:
     """Handle single rule
 
     Workflow:
@@ -109,18 +126,17 @@ async def _handle_rule(rule: RulePayload, process_fn, event_name: str) -> HookRe
     3. Call event_handler.process()
     4. Return HookResult
     """
-    event = get_event()
     rule_name = rule.get('name', 'unknown')
 
     logger.debug(f"Processing rule: {rule_name}")
 
     # Quick filter by tool
-    if 'tool' in rule and rule['tool'] != getattr(event, 'tool_name', None):
+    if 'tool' in rule and rule['tool'] != tool_name:
         logger.debug(f"Rule {rule_name} skipped: tool mismatch")
         return None
 
     # Detailed match
-    if not _matches_rule(rule, event):
+    if not _matches_rule(rule, get_event(), command):
         logger.debug(f"Rule {rule_name} skipped: match failed")
         return None
 
@@ -129,9 +145,7 @@ async def _handle_rule(rule: RulePayload, process_fn, event_name: str) -> HookRe
     # Call event handler
     try:
         # process(rule) - event retrieved from global context
-        result = process_fn(rule)
-        if inspect.isawaitable(result):
-            result = await result
+        result = await process_fn(rule)
 
         if result:
             logger.debug(f"Rule {rule_name} returned result")
@@ -141,8 +155,11 @@ async def _handle_rule(rule: RulePayload, process_fn, event_name: str) -> HookRe
         return None
 
 
-def _matches_rule(rule: RulePayload, event) -> bool:
-    """檢查 event 是否符合 rule 的 match 條件"""
+def _matches_rule(rule: RulePayload, event, command: Optional[str]) -> bool:
+    """檢查 event 是否符合 rule 的 match 條件
+
+    command: route() 預先取出的 tool_input.command（每個事件只取一次）
+    """
     if 'match' not in rule:
         return True
 
@@ -150,23 +167,17 @@ def _matches_rule(rule: RulePayload, event) -> bool:
 
     # 字串：regex 匹配
     if isinstance(match_config, str):
-        compiled = rule.get('_match_re')
-        command = _event_tool_command(event)
+        compiled = rule.get('_match_re') or compile_pattern(match_config)
         # 優先匹配 prompt/command 字段
         if hasattr(event, 'prompt'):
-            if compiled:
-                return bool(compiled.search(event.prompt))
-            return bool(re.search(match_config, event.prompt))
+            return bool(compiled.search(event.prompt))
         elif command is not None:
-            if compiled:
-                return bool(compiled.search(command))
-            return bool(re.search(match_config, command))
+            return bool(compiled.search(command))
         return False
 
     # 物件：結構化匹配
     if isinstance(match_config, dict):
         # Bash 專用的結構化匹配
-        command = _event_tool_command(event)
         if command is not None:
             return _matches_bash_struct(rule, match_config, command)
         return False
@@ -178,37 +189,33 @@ def _matches_bash_struct(rule: RulePayload, config: Dict[str, Any], command: str
     """Bash 結構化匹配"""
     tokens = tokenize(command)
     first_token = tokens[0] if tokens else ""
-    args_tokens = tokens[1:] if len(tokens) > 1 else []
 
     # cmd 必須匹配
     if 'cmd' in config:
-        cmd_re = rule.get('_cmd_re')
-        if cmd_re:
-            if not first_token or not cmd_re.match(first_token):
-                return False
-        elif not first_token or not re.match(config['cmd'], first_token):
+        cmd_re = rule.get('_cmd_re') or compile_pattern(config['cmd'])
+        if not first_token or not cmd_re.match(first_token):
             return False
 
-    # any_cmd: 複合命令任一
+    # any_cmd: 複合命令任一（載入時預建 frozenset）
     if 'any_cmd' in config:
-        if first_token not in config['any_cmd']:
+        if first_token not in rule.get('_any_cmd', config['any_cmd']):
             return False
 
-    # flags: 必須有的 flags
+    # flags: 必須有的 flags（載入時預建 -x/--x 字串）
     if 'flags' in config:
-        for flag in config['flags']:
-            if f'-{flag}' not in command and f'--{flag}' not in command:
+        needles = rule.get('_flag_needles')
+        if needles is None:
+            needles = rules_loader.flag_needles(config['flags'])
+        for short, long in needles:
+            if short not in command and long not in command:
                 return False
 
     # args: args regex
     if 'args' in config:
-        # 提取 args (跳過第一個單詞和 flags)
-        args_str = ' '.join([p for p in args_tokens if not p.startswith('-')])
-        args_re = rule.get('_args_re')
-        if args_re:
-            if not args_re.search(args_str):
-                return False
-        elif not re.search(config['args'], args_str):
+        # 提取 args (跳過第一個單詞和 flags)；只在需要時切片
+        args_str = ' '.join([p for p in tokens[1:] if not p.startswith('-')])
+        args_re = rule.get('_args_re') or compile_pattern(config['args'])
+        if not args_re.search(args_str):
             return False
 
     return True
@@ -57,9 +57,11 @@ def main():
     if args.level in ["basic", "all"]:
         from test_basic import run_basic_tests
         from test_utils.test_logger import run_logger_tests
+        from test_utils.test_files import run_files_tests
 
         run_basic_tests(runner)
         run_logger_tests(runner)
+        run_files_tests(runner)
 
     # Level 2: Schema Tests
     if args.level in ["schema", "all"]:
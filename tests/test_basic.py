@@ -61,6 +61,35 @@ def run_basic_tests(runner: TestRunner):
             "PASS" if passed else "FAIL"
         )
 
+    _test_lone_surrogate_payload(runner)
+
+
+def _test_lone_surrogate_payload(runner: TestRunner):
+    """孤立 UTF-16 surrogate（截斷的 emoji）不應中斷流程
+
+    JS 的 JSON.stringify 會輸出 "\\ud83d" 這類跳脫，標準庫 json 可解析
+    """
+    event_data = _minimal_event("UserPromptSubmit")
+    event_data["prompt"] = "hi \ud83d"
+
+    success, output, stderr = runner.run_main(event_data)
+    passed = success and isinstance(output, dict) and output.get("continue") is not False
+
+    result = TestResult(
+        name="UserPromptSubmit - 孤立 surrogate payload",
+        level=TestLevel.BASIC,
+        passed=passed,
+        message="成功執行並返回 JSON" if passed else "執行失敗",
+        details={"output": output, "stderr": stderr[:200] if stderr else ""},
+        error=None if passed else (stderr or str(output))
+    )
+
+    runner.report.add(result)
+    runner.log(
+        f"UserPromptSubmit (lone surrogate): {'PASS' if passed else 'FAIL'}",
+        "PASS" if passed else "FAIL"
+    )
+
 
 def _minimal_event(event_name: str) -> dict:
     """生成最小事件數據"""
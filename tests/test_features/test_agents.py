@@ -131,6 +131,21 @@ class TestMatchAgents:
         matched = agents.match_agents('hello world')
         assert matched == []
 
+    def test_match_word_start_only(self):
+        """測試觸發詞需在詞首（'infrastructure' 不觸發 architecture）"""
+        matched = agents.match_agents('update the infrastructure config')
+        assert 'architecture' not in matched
+
+    def test_match_insecure_keyword(self):
+        """測試 insecure 觸發 security"""
+        matched = agents.match_agents('this endpoint is insecure')
+        assert 'security' in matched
+
+    def test_match_cjk_adjacent(self):
+        """測試中文緊鄰英文仍可匹配"""
+        matched = agents.match_agents('檢查security問題')
+        assert 'security' in matched
+
 
 class TestGetAgentInfo:
     """測試 get_agent_info()"""
@@ -112,6 +112,26 @@ class TestMatchSkills:
         matched = skills.match_skills('')
         assert matched == []
 
+    def test_match_word_start_only(self):
+        """測試觸發詞需在詞首（'latest' 不觸發 test）"""
+        matched = skills.match_skills('show me the latest release')
+        assert 'test' not in matched
+
+    def test_match_pytest_unittest(self):
+        """測試 pytest / unittest 觸發 test"""
+        assert 'test' in skills.match_skills('add pytest cases')
+        assert 'test' in skills.match_skills('fix the unittest suite')
+
+    def test_match_undocumented(self):
+        """測試 undocumented 觸發 document"""
+        matched = skills.match_skills('this module is undocumented')
+        assert 'document' in matched
+
+    def test_match_cjk_adjacent(self):
+        """測試中文緊鄰英文仍可匹配"""
+        matched = skills.match_skills('幫我寫test')
+        assert 'test' in matched
+
 
 class TestGetSkillInfo:
     """測試 get_skill_info()"""
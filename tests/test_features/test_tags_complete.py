@@ -178,6 +178,39 @@ class TestTodoList:
         assert result is not None
         assert '高優先任務' in result
 
+    def test_todo_list_stats_global(self):
+        """測試全局統計直接由已取回的 todos 彙總（不再額外查詢）"""
+        mock_todos = [
+            {'_key': 't1', 'content': 'a', 'priority': 5, 'status': 'pending', 'tags': []},
+            {'_key': 't2', 'content': 'b', 'priority': 5, 'status': 'pending', 'tags': []},
+            {'_key': 't3', 'content': 'c', 'priority': 5, 'status': 'done', 'tags': []},
+        ]
+
+        with patch('utils.db.query_aql', return_value=mock_todos) as mock_query:
+            result = todo.list_todos(None, '_user', show_all=True)
+
+        assert mock_query.call_count == 1
+        assert '**全局** 3 総計, 🔍 觀察 1, ⏳ 未完成 2' in result
+
+    def test_todo_list_stats_project(self):
+        """測試專案模式：全局用 WITH COUNT INTO 計數，專案由取回的 todos 彙總"""
+        mock_todos = [
+            {'_key': 't1', 'content': 'a', 'priority': 5, 'status': 'pending', 'tags': [], 'project': 'proj'},
+            {'_key': 't2', 'content': 'b', 'priority': 5, 'status': 'done', 'tags': [], 'project': 'proj'},
+        ]
+        global_counts = [
+            {'status': 'pending', 'count': 4},
+            {'status': 'done', 'count': 3},
+        ]
+
+        with patch('utils.db.query_aql', side_effect=[mock_todos, global_counts]) as mock_query:
+            result = todo.list_todos(None, 'proj', show_all=True)
+
+        assert mock_query.call_count == 2
+        assert 'WITH COUNT INTO' in mock_query.call_args_list[1].args[0]
+        assert '**全局** 7 総計, 🔍 觀察 3, ⏳ 未完成 4' in result
+        assert '**proj** 2 総計, 🔍 觀察 1, ⏳ 未完成 1' in result
+
 
 class TestTodoDone:
     """測試 /tags todo done"""
@@ -37,3 +37,29 @@ async def test_process_additional_context():
 
     assert isinstance(result, HookResult)
     assert result.additional_context == 'test context'
+
+@pytest.mark.asyncio
+async def test_call_feature_awaits_coroutine_from_sync_process():
+    """sync-looking process() (e.g. decorated) returning a coroutine is awaited"""
+    import functools
+    import sys
+    import types
+    from handlers import UserPromptSubmit
+
+    async def _inner():
+        return 'wrapped context'
+
+    @functools.wraps(_inner)
+    def _wrapped():
+        return _inner()
+
+    mod = types.ModuleType('features._test_wrapped')
+    mod.process = _wrapped
+    sys.modules['features._test_wrapped'] = mod
+    try:
+        result = await UserPromptSubmit._call_feature('_test_wrapped')
+    finally:
+        sys.modules.pop('features._test_wrapped', None)
+        UserPromptSubmit._feature_cache.pop('_test_wrapped', None)
+
+    assert result == 'wrapped context'
@@ -37,6 +37,12 @@ def run_rules_tests(runner: TestRunner):
     # 4. Rule 實際執行測試（新增）
     _test_rule_execution(runner)
 
+    # 5. 無效 updatedInput.pattern 不應丟棄整條規則
+    _test_invalid_updated_input_pattern(runner)
+
+    # 6. any_cmd 含非字串項目不應中斷載入
+    _test_unhashable_any_cmd(runner)
+
 
 def _test_rule_files(runner: TestRunner, rules_dir: Path):
     """測試 Rule 檔案格式"""
@@ -300,6 +306,119 @@ def _test_rule_execution(runner: TestRunner):
         )
 
 
+def _test_invalid_updated_input_pattern(runner: TestRunner):
+    """無效 updatedInput.pattern：保留規則（deny 仍生效），只略過轉換"""
+    runner.log("\n--- 無效 updatedInput pattern ---")
+
+    import tempfile
+    from loaders import rules as rules_loader
+    from handlers.PreToolUse import _apply_updated_input
+
+    content = (
+        "---\n"
+        "name: deny-bad-updated-input\n"
+        "description: test\n"
+        "event: PreToolUse\n"
+        "tool: Bash\n"
+        "match:\n"
+        "  cmd: sudo\n"
+        "action: deny\n"
+        "reason: test\n"
+        "updatedInput:\n"
+        "  field: command\n"
+        "  pattern: '^(sudo'\n"
+        "  replace: echo\n"
+        "---\n"
+    )
+
+    error = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            rule_file = Path(tmp) / "deny-bad-updated-input.md"
+            rule_file.write_text(content, encoding="utf-8")
+            rule = rules_loader._parse_rule_file(rule_file)
+
+        kept = rule is not None and rule.get("action") == "deny"
+        uncompiled = kept and "_updated_input_re" not in rule
+        transformed = kept and _apply_updated_input(
+            rule["updatedInput"], {"command": "sudo ls"}, rule.get("_updated_input_re")
+        )
+        passed = kept and uncompiled and transformed is None
+        if not passed:
+            error = f"rule={rule!r}, transformed={transformed!r}"
+    except Exception as e:
+        passed = False
+        error = str(e)
+
+    result = TestResult(
+        name="無效 updatedInput pattern 保留規則",
+        level=TestLevel.RULES,
+        passed=passed,
+        message="規則保留、轉換略過" if passed else "規則被丟棄或轉換未略過",
+        error=error
+    )
+
+    runner.report.add(result)
+    runner.log(
+        f"Invalid updatedInput pattern: {'PASS' if passed else 'FAIL'}",
+        "PASS" if passed else "FAIL"
+    )
+
+
+def _test_unhashable_any_cmd(runner: TestRunner):
+    """any_cmd 含 mapping 項目：規則照常載入（不預建 frozenset），匹配時不命中"""
+    runner.log("\n--- 非字串 any_cmd 項目 ---")
+
+    import tempfile
+    from loaders import rules as rules_loader
+    from router import _matches_bash_struct
+
+    content = (
+        "---\n"
+        "name: ask-git-unhashable-any-cmd\n"
+        "description: test\n"
+        "event: PreToolUse\n"
+        "tool: Bash\n"
+        "match:\n"
+        "  cmd: git\n"
+        "  any_cmd:\n"
+        "    - git: status\n"
+        "action: ask\n"
+        "reason: test\n"
+        "---\n"
+    )
+
+    error = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            rule_file = Path(tmp) / "ask-git-unhashable-any-cmd.md"
+            rule_file.write_text(content, encoding="utf-8")
+            rule = rules_loader._parse_rule_file(rule_file)
+
+        kept = rule is not None and "_any_cmd" not in rule
+        matched = kept and _matches_bash_struct(rule, rule["match"], "git status")
+        passed = kept and matched is False
+        if not passed:
+            error = f"rule={rule!r}, matched={matched!r}"
+    except Exception as e:
+        passed = False
+        error = f"{type(e).__name__}: {e}"
+
+    result = TestResult(
+        name="非字串 any_cmd 項目不中斷載入",
+        level=TestLevel.RULES,
+        passed=passed,
+        message="規則載入、匹配不命中" if passed else "載入失敗或拋出例外",
+        error=error
+    )
+
+    runner.report.add(result)
+    runner.log(
+        f"Unhashable any_cmd: {'PASS' if passed else 'FAIL'}",
+        "PASS" if passed else "FAIL"
+    )
+
+
 if __name__ == "__main__":
     runner = TestRunner(verbose=True)
     run_rules_tests(runner)
@@ -180,6 +180,52 @@ class TestDBConnection:
                     db.get_db()
 
 
+class TestDBFailureLatch:
+    """Test that a failed connection is not retried until reset"""
+
+    @pytest.fixture
+    def failing_connect(self):
+        """ArangoClient that always fails; counts connection attempts"""
+        class StubHTTPClient:
+            def __init__(self, **kwargs):
+                pass
+
+        fake_http = MagicMock()
+        fake_http.DefaultHTTPClient = StubHTTPClient
+        with patch.dict("sys.modules", {"arango.http": fake_http}), \
+                patch("utils.db.ARANGO_AVAILABLE", True), \
+                patch("utils.db._get_db_config", return_value={
+                    "host": "http://localhost:8529",
+                    "database": "testdb",
+                    "username": "root",
+                    "password": "password",
+                }), \
+                patch("utils.db.ArangoClient", side_effect=Exception("Connection refused")) as mock_client:
+            yield mock_client
+
+    def test_failed_connect_not_retried(self, failing_connect):
+        """Test second get_db() returns None without reconnecting"""
+        from utils import db
+        assert db.get_db() is None
+        assert "Connection refused" in db.get_db_error()
+        assert failing_connect.call_count == 1
+
+        assert db.get_db() is None
+        assert failing_connect.call_count == 1
+
+    def test_reset_allows_retry(self, failing_connect):
+        """Test reset_db_connection() clears the latch so the next call reconnects"""
+        from utils import db
+        assert db.get_db() is None
+        assert failing_connect.call_count == 1
+
+        db.reset_db_connection()
+        assert db.get_db_error() is None
+
+        assert db.get_db() is None
+        assert failing_connect.call_count == 2
+
+
 # ============ CRUD Operation Tests ============
 
 
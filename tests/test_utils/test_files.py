@@ -0,0 +1,160 @@
+"""Test utils/files.py read_text_file (load action file reader)"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from framework import TestRunner, TestResult, TestLevel
+from utils.files import read_text_file, MAX_LOAD_BYTES, SNIFF_BYTES
+
+
+def run_files_tests(runner: TestRunner):
+    """Run file reader tests"""
+    runner.log("="*60)
+    runner.log("File Reader Tests")
+    runner.log("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        # Test 1: Plain UTF-8 text
+        _test_utf8_text(runner, tmp_dir)
+
+        # Test 2: CRLF/CR newlines normalised
+        _test_newlines(runner, tmp_dir)
+
+        # Test 3: Size cap
+        _test_size_cap(runner, tmp_dir)
+
+        # Test 4: NUL byte sniff
+        _test_nul_sniff(runner, tmp_dir)
+
+        # Test 5: Non-UTF-8 content
+        _test_non_utf8(runner, tmp_dir)
+
+        # Test 6: Missing / unreadable path
+        _test_unreadable(runner, tmp_dir)
+
+
+def _report(runner: TestRunner, name: str, passed: bool, value):
+    """Add result and log"""
+    result = TestResult(
+        name=name,
+        level=TestLevel.BASIC,
+        passed=passed,
+        message=f"Result: {value!r}"[:120],
+    )
+
+    runner.report.add(result)
+    runner.log(
+        f"{name}: {'PASS' if passed else 'FAIL'}",
+        "PASS" if passed else "FAIL"
+    )
+
+
+def _test_utf8_text(runner: TestRunner, tmp_dir: Path):
+    """Test UTF-8 text is returned as-is"""
+    runner.log("\n--- UTF-8 Text ---")
+
+    path = tmp_dir / "utf8.md"
+    path.write_bytes("中文 text\n".encode("utf-8"))
+    value = read_text_file(str(path))
+
+    _report(runner, "UTF-8 text read", value == "中文 text\n", value)
+
+
+def _test_newlines(runner: TestRunner, tmp_dir: Path):
+    """Test CRLF and CR are translated to LF (read_text() semantics)"""
+    runner.log("\n--- Newline Translation ---")
+
+    path = tmp_dir / "crlf.md"
+    path.write_bytes(b"a\r\nb\rc\n")
+    value = read_text_file(str(path))
+
+    _report(runner, "CRLF/CR translated to LF", value == "a\nb\nc\n", value)
+
+
+def _test_size_cap(runner: TestRunner, tmp_dir: Path):
+    """Test files over MAX_LOAD_BYTES are skipped, files at the cap are read"""
+    runner.log("\n--- Size Cap ---")
+
+    # Sparse files: size is set without writing MAX_LOAD_BYTES of data
+    # (the sparse tail reads back as NUL, so keep the sniff window text-only)
+    at_cap = tmp_dir / "at_cap.md"
+    with open(at_cap, "wb") as f:
+        f.write(b"x" * SNIFF_BYTES)
+        f.truncate(MAX_LOAD_BYTES)
+    at_cap_value = read_text_file(str(at_cap))
+    at_cap_read = at_cap_value is not None and len(at_cap_value) == MAX_LOAD_BYTES
+
+    over_cap = tmp_dir / "over_cap.md"
+    with open(over_cap, "wb") as f:
+        f.write(b"x" * SNIFF_BYTES)
+        f.truncate(MAX_LOAD_BYTES + 1)
+    over_cap_value = read_text_file(str(over_cap))
+
+    _report(
+        runner,
+        "Size cap (over skipped)",
+        over_cap_value is None,
+        over_cap_value if over_cap_value is None else len(over_cap_value),
+    )
+    _report(
+        runner,
+        "Size cap (at cap read)",
+        at_cap_read,
+        None if at_cap_value is None else len(at_cap_value),
+    )
+
+
+def _test_nul_sniff(runner: TestRunner, tmp_dir: Path):
+    """Test NUL within the sniff window marks the file as binary"""
+    runner.log("\n--- NUL Byte Sniff ---")
+
+    binary = tmp_dir / "binary.bin"
+    binary.write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+    binary_value = read_text_file(str(binary))
+
+    # NUL past the sniff window is not inspected
+    late_nul = tmp_dir / "late_nul.md"
+    late_nul.write_bytes(b"x" * SNIFF_BYTES + b"\x00")
+    late_value = read_text_file(str(late_nul))
+
+    _report(runner, "NUL sniff (binary skipped)", binary_value is None, binary_value)
+    _report(
+        runner,
+        "NUL sniff (outside window read)",
+        late_value is not None and len(late_value) == SNIFF_BYTES + 1,
+        None if late_value is None else len(late_value),
+    )
+
+
+def _test_non_utf8(runner: TestRunner, tmp_dir: Path):
+    """Test non-UTF-8 content is skipped"""
+    runner.log("\n--- Non-UTF-8 ---")
+
+    path = tmp_dir / "latin1.md"
+    path.write_bytes("café".encode("latin-1"))
+    value = read_text_file(str(path))
+
+    _report(runner, "Non-UTF-8 skipped", value is None, value)
+
+
+def _test_unreadable(runner: TestRunner, tmp_dir: Path):
+    """Test missing files and directories are skipped"""
+    runner.log("\n--- Unreadable Paths ---")
+
+    missing = read_text_file(str(tmp_dir / "missing.md"))
+    directory = read_text_file(str(tmp_dir))
+
+    _report(runner, "Missing file skipped", missing is None, missing)
+    _report(runner, "Directory skipped", directory is None, directory)
+
+
+if __name__ == "__main__":
+    runner = TestRunner(verbose=True)
+    run_files_tests(runner)
+    runner.print_report()
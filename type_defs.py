@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class HookResult:
     """Hook 處理結果統一介面"""
 
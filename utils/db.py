@@ -47,7 +47,7 @@ def get_db() -> Optional[StandardDatabase]:
       - StandardDatabase：連接成功
       - None：連接失敗（詳見 get_db_error()）
 
-    連不上就返回 None，不重試不卡住
+    連不上就返回 None，不重試不卡住；失敗結果保留到 reset_db_connection()
     """
     global _db_instance, _db_error
 
@@ -60,6 +60,11 @@ def get_db() -> Optional[StandardDatabase]:
     if _db_instance is not None:
         return _db_instance
 
+    # 已連線失敗過：直接返回，不讓後續呼叫重複等待連線 timeout
+    # （reset_db_connection() 後才會再嘗試）
+    if _db_error is not None:
+        return None
+
     config = _get_db_config()
 
     try:
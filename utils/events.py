@@ -3,26 +3,32 @@
 Pipeline:
 raw payload -> schema object tree projector -> typed event dataclass
 """
-import json
 from dataclasses import dataclass, field, make_dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 
+from utils import fastjson
 
-@dataclass
+
+# Shared read-only default for leaf nodes (most nodes have no properties)
+_NO_PROPERTIES: Mapping[str, "TreeNode"] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class TreeNode:
     """Runtime object-tree node compiled from JSON schema."""
 
     node_type: str = "any"
-    required: List[str] = field(default_factory=list)
-    properties: Dict[str, "TreeNode"] = field(default_factory=dict)
+    required: Tuple[str, ...] = ()
+    properties: Mapping[str, "TreeNode"] = field(default_factory=lambda: _NO_PROPERTIES)
     items: Optional["TreeNode"] = None
     enum: Optional[List[Any]] = None
     const: Optional[Any] = None
     additional_properties: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeObject:
     """Attribute-first object wrapper for projected schema objects."""
 
@@ -66,11 +72,25 @@ def _load_schemas() -> Dict[str, Dict[str, Any]]:
     schema_dir = Path(__file__).parent.parent / "config" / "schema"
     schemas: Dict[str, Dict[str, Any]] = {}
     for schema_file in schema_dir.glob("*.json"):
-        with open(schema_file, "r", encoding="utf-8") as f:
-            schemas[schema_file.stem] = json.load(f)
+        schemas[schema_file.stem] = fastjson.load_file(schema_file)
     return schemas
 
 
+_schemas: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def load_schemas() -> Dict[str, Dict[str, Any]]:
+    """Parsed event schemas, read once per process.
+
+    Shared by the event registry below and utils.schema_validator so the
+    schema files are not parsed twice per hook run. Treat as read-only.
+    """
+    global _schemas
+    if _schemas is None:
+        _schemas = _load_schemas()
+    return _schemas
+
+
 def _json_type_to_python(field_def: Dict[str, Any]):
     """Map JSON schema type to Python hint."""
     field_type = field_def.get("type", "string")
@@ -94,15 +114,16 @@ def _build_tree(defn: Dict[str, Any]) -> TreeNode:
     node_type = defn.get("type", "any")
     node = TreeNode(
         node_type=node_type,
-        required=list(defn.get("required", [])),
+        required=tuple(defn.get("required", ())),
         enum=defn.get("enum"),
         const=defn.get("const"),
         additional_properties=defn.get("additionalProperties", True),
     )
 
     if node_type == "object":
-        for name, child in defn.get("properties", {}).items():
-            node.properties[name] = _build_tree(child)
+        properties = defn.get("properties")
+        if properties:
+            node.properties = {name: _build_tree(child) for name, child in properties.items()}
     elif node_type == "array" and isinstance(defn.get("items"), dict):
         node.items = _build_tree(defn["items"])
 
@@ -111,7 +132,7 @@ def _build_tree(defn: Dict[str, Any]) -> TreeNode:
 
 def _build_schema_registry():
     """Build event class + event tree registries from schemas."""
-    schemas = _load_schemas()
+    schemas = load_schemas()
     event_classes: Dict[str, Any] = {}
     event_trees: Dict[str, TreeNode] = {}
 
@@ -0,0 +1,69 @@
+"""JSON 解析加速層
+
+優先使用 orjson（C 實作，可選依賴），未安裝時 fallback 到標準庫 json。
+用於解析路徑（stdin payload、schema 檔案）與 hook 輸出序列化；
+dumps 維持 ensure_ascii=False 語義（非 ASCII 字元原樣輸出）。
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# orjson 將超出 64-bit 的整數轉成 float；這類整數至少 19 位數字
+# （字串內的長數字也會命中，只是多一次標準庫解析，結果不變）
+_LONG_INT_STR = re.compile(r'\d{19}')
+_LONG_INT_BYTES = re.compile(rb'\d{19}')
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子類，呼叫端照舊捕捉即可
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """解析 JSON 字串或 bytes
+
+    orjson 比標準庫嚴格（拒絕孤立 surrogate 跳脫、NaN，超過 64-bit 的整數轉成 float），
+    失敗或數值可能失真時改用標準庫重新解析，以標準庫結果為準
+    """
+    if HAS_ORJSON:
+        try:
+            result = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not _may_lose_int(data):
+                return result
+    return json.loads(data)
+
+
+def _may_lose_int(data: Union[str, bytes, bytearray]) -> bool:
+    """是否含有 orjson 可能轉成 float 的長整數（19 位以上數字）"""
+    if isinstance(data, str):
+        return _LONG_INT_STR.search(data) is not None
+    return _LONG_INT_BYTES.search(data) is not None
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """以 binary 讀取並解析 JSON 檔案（省去 text decode 層）"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dumps(obj: Any) -> str:
+    """序列化為 JSON 字串（compact，非 ASCII 原樣輸出）
+
+    orjson 不支援的值（如超過 64-bit 的整數）fallback 到標準庫
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            # orjson.JSONEncodeError 是 TypeError 的子類
+            pass
+    return json.dumps(obj, ensure_ascii=False)
@@ -0,0 +1,41 @@
+"""文字檔讀取 — load action 與 rule 檔共用
+
+SessionStart / SubagentStart 的 load action 皆經此讀檔：
+失敗、過大、binary 或非 UTF-8 的檔案一律略過（返回 None）
+rule 檔（loaders.rules）只共用 decode_text
+"""
+import os
+from pathlib import Path
+from typing import Optional
+
+# load action 檔案上限：超過即跳過，不整檔讀入
+MAX_LOAD_BYTES = 10 * 1024 * 1024
+# binary 判斷：開頭區塊含 NUL 視為非文字檔
+SNIFF_BYTES = 4096
+
+
+def decode_text(data: bytes) -> str:
+    """UTF-8 decode 並做與 read_text() 相同的換行轉換（CRLF/CR → LF）
+
+    Raises:
+        UnicodeDecodeError: 非 UTF-8 內容
+    """
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def read_text_file(path: str) -> Optional[str]:
+    """讀取單一文字檔，失敗返回 None（忽略讀取失敗、過大或 binary 的檔案）
+
+    以 binary 一次讀入再於記憶體 decode，不經 TextIOWrapper 逐塊解碼
+    """
+    try:
+        # 單次 open：大小檢查用 fstat（不另做一次路徑 stat）
+        with open(Path(path).expanduser(), 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MAX_LOAD_BYTES:
+                return None
+            data = f.read()
+        if b'\x00' in data[:SNIFF_BYTES]:
+            return None
+        return decode_text(data)
+    except Exception:
+        return None
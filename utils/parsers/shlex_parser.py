@@ -2,7 +2,8 @@
 
 import shlex
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 
 def parse(text: str) -> Dict[str, Any]:
@@ -91,9 +92,13 @@ def parse(text: str) -> Dict[str, Any]:
         }
 
 
-def tokenize(text: str) -> List[str]:
-    """僅分詞"""
+@lru_cache(maxsize=256)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """僅分詞（結果快取：同一命令被多條 Bash 規則匹配時只分詞一次）
+
+    回傳 tuple，快取共用的結果不可被呼叫端修改
+    """
     try:
-        return shlex.split(text)
+        return tuple(shlex.split(text))
     except ValueError:
-        return text.split()
+        return tuple(text.split())
@@ -0,0 +1,23 @@
+"""Regex helpers — compiled pattern cache shared by rules, router and features"""
+import re
+from functools import lru_cache
+from typing import Iterable
+
+# 觸發詞需從英數字詞首開始（避免 'latest' 命中 'test'）；
+# 用 ASCII lookbehind 而非 \b，中文緊鄰英文（如「寫test」）仍可命中
+_WORD_START = r'(?<![a-z0-9_])'
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile regex once per distinct pattern string (shared across rules)
+
+    Raises:
+        re.error: invalid pattern
+    """
+    return re.compile(pattern)
+
+
+def compile_keywords(keywords: Iterable[str]) -> re.Pattern:
+    """Compile trigger words into one case-insensitive word-start alternation"""
+    return re.compile(_WORD_START + '(?:' + '|'.join(map(re.escape, keywords)) + ')', re.IGNORECASE)
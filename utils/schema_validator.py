@@ -2,12 +2,14 @@
 Schema 驗證器
 根據 config/schema/ 中的 JSON Schema 驗證 events/responses/rules
 """
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError, RefResolver
+    from jsonschema import ValidationError, RefResolver
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
@@ -22,6 +24,8 @@ class SchemaValidator:
     def __init__(self):
         # 載入所有 schema (event_name.json)
         self.schemas: Dict[str, dict] = {}
+        # (event_name, 子 schema 名) → 已編譯 validator
+        self._validators: Dict[Tuple[str, str], Any] = {}
         self._load_schemas()
 
     def _load_schemas(self):
@@ -29,11 +33,30 @@ class SchemaValidator:
         if not SCHEMA_DIR.exists():
             return
 
-        for schema_file in SCHEMA_DIR.glob("*.json"):
-            event_name = schema_file.stem
-            with open(schema_file) as f:
-                schema = json.load(f)
-                self.schemas[event_name] = schema
+        # 與 utils.events 共用同一份已解析的 schema（每次執行只讀一次檔）
+        from utils.events import load_schemas
+        self.schemas.update(load_schemas())
+
+    def _validate(self, event_name: str, kind: str, schema: dict, instance: Any):
+        """以快取的 validator 驗證 (等同 jsonschema.validate)
+
+        jsonschema.validate 每次呼叫都會 check_schema 並重建 validator；
+        這裡每個 (event, 子 schema) 只做一次，之後直接 iter_errors。
+
+        Raises:
+            ValidationError: 取 best_match，與 jsonschema.validate 相同
+        """
+        key = (event_name, kind)
+        validator = self._validators.get(key)
+        if validator is None:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema)
+            self._validators[key] = validator
+
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
 
     def validate_event(self, event_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -62,7 +85,7 @@ class SchemaValidator:
             return f"No event schema found in {event_name}.json"
 
         try:
-            validate(instance=event_data, schema=event_schema)
+            self._validate(event_name, 'event', event_schema, event_data)
             return None
         except ValidationError as e:
             return f"Event validation failed: {e.message}"
@@ -91,7 +114,7 @@ class SchemaValidator:
             return f"No response schema found in {event_name}.json"
 
         try:
-            validate(instance=response_data, schema=response_schema)
+            self._validate(event_name, 'response', response_schema, response_data)
             return None
         except ValidationError as e:
             return f"Response validation failed: {e.message}"
@@ -123,7 +146,7 @@ class SchemaValidator:
             return f"No rule schema found in {event_type}.json"
 
         try:
-            validate(instance=rule_config, schema=rule_schema)
+            self._validate(event_type, 'rule', rule_schema, rule_config)
             return None
         except ValidationError as e:
             return f"Rule validation failed: {e.message}"